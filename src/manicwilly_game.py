@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import functools
+import heapq
 import json
 import math
+import os
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
 
 import pygame
 
+try:
+    import orjson            # optional: faster JSON parse/dump when installed
+except ImportError:
+    orjson = None
+
 # ── Resolution ─────────────────────────────────────────────────────────────────
 # The game renders internally at GAME_W × GAME_H (ZX-Spectrum-scale resolution)
 # and is then scaled up 2× to fill the display window.  All physics, collision
@@ -16,6 +25,8 @@ import pygame
 DISPLAY_W, DISPLAY_H = 960, 600   # actual window
 GAME_W,    GAME_H    = 480, 300   # internal game canvas
 RS = 2                             # room-coordinate scale (rooms.json ÷ RS)
+UPSCALE = DISPLAY_W // GAME_W      # game canvas → window pixel scale
+WORLD_RECT = pygame.Rect(0, 0, GAME_W, GAME_H - 10)   # player bounds; bottom = floor
 
 # ── Physics (tuned for GAME_W×GAME_H, slower ZX-Spectrum feel) ─────────────────
 GRAVITY      = 380    # px/s²
@@ -23,6 +34,22 @@ PLAYER_SPEED = 95     # px/s
 JUMP_SPEED   = 240    # px/s  –  height ≈ 240²/(2×380) ≈ 76 px (game) = 152 px (screen)
 ITEM_TARGET_SECONDS = 30 * 60
 
+# Player and enemy physics run at a fixed step so motion is frame-rate
+# independent and the per-step increments below fold into constants.  The
+# step matches the 60 fps cap the movement was tuned at: positions snap to
+# whole pixels every step, so a shorter step would change walk/climb speed.
+PHYS_DT      = 1 / 60
+DX_PER_STEP  = PLAYER_SPEED * PHYS_DT
+CLIMB_STEP   = PLAYER_SPEED * 0.65 * PHYS_DT
+GRAV_STEP    = GRAVITY * PHYS_DT
+CENTRE_LERP  = min(1.0, PHYS_DT * 18)   # stair-centring blend per step
+MAX_FRAME_DT = 0.25                     # cap catch-up after a stall
+
+# Key constants bound once so hot paths skip the pygame module lookup
+_K_LEFT,  _K_RIGHT, _K_UP, _K_DOWN = pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN
+_K_A,     _K_D,     _K_W,  _K_S    = pygame.K_a,    pygame.K_d,     pygame.K_w,  pygame.K_s
+_K_SPACE, _K_RETURN                = pygame.K_SPACE, pygame.K_RETURN
+
 ROOT       = Path(__file__).resolve().parents[1]
 ROOMS_FILE = ROOT / "data" / "rooms.json"
 SCORE_FILE = ROOT / "data" / "highscores.json"
@@ -76,13 +103,7 @@ class Sounds:
 
 # ── Data classes ────────────────────────────────────────────────────────────────
 
-@dataclass
-class Collectible:
-    pos: pygame.Vector2
-    taken: bool = False
-
-
-@dataclass
+@dataclass(slots=True)
 class Stair:
     rect: pygame.Rect
     target: str | None = None
@@ -90,32 +111,65 @@ class Stair:
 
 
 class Enemy:
+    __slots__ = ("segs", "step", "index", "remaining", "x", "y", "rect", "awake")
+
     def __init__(self, points: list[list[float]], speed: float):
         # Scale path from rooms.json coordinates into game space
-        self.points = [pygame.Vector2(p[0] / RS, p[1] / RS) for p in points]
-        self.speed  = speed / RS
-        self.index  = 1 if len(self.points) > 1 else 0
-        self.pos    = self.points[0].copy()
-
-    def update(self, dt: float):
-        if len(self.points) < 2:
-            return
-        target = self.points[self.index]
-        delta  = target - self.pos
-        dist   = delta.length()
-        if dist < 1:
-            self.index = (self.index + 1) % len(self.points)
-            return
-        self.pos += delta.normalize() * min(self.speed * dt, dist)
-
-    def rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.pos.x) - 9, int(self.pos.y) - 9, 18, 18)
+        pts = [(p[0] / RS, p[1] / RS) for p in points]
+        # segs[i] leads from pts[i - 1] to pts[i]: (end x, end y, unit x, unit y, length)
+        self.segs = []
+        for (x0, y0), (x1, y1) in zip(pts[-1:] + pts[:-1], pts):
+            length = math.hypot(x1 - x0, y1 - y0)
+            ux, uy = ((x1 - x0) / length, (y1 - y0) / length) if length else (0.0, 0.0)
+            self.segs.append((x1, y1, ux, uy, length))
+        self.step      = speed / RS * PHYS_DT   # distance covered per physics step
+        self.index     = 1 if len(pts) > 1 else 0
+        self.remaining = self.segs[self.index][4]   # distance left to the next waypoint
+        self.awake     = len(pts) >= 2   # single-point enemies never move
+        self.x, self.y = pts[0]
+        # Hitbox kept in sync by update(); shared by collision and drawing
+        self.rect   = pygame.Rect(int(self.x) - 9, int(self.y) - 9, 18, 18)
+
+    def update(self):
+        """Advance along the patrol path by one fixed PHYS_DT step (awake enemies only)."""
+        # Segment directions are precomputed, so a step is two multiply-adds
+        tx, ty, ux, uy, _ = self.segs[self.index]
+        step = self.step
+        if self.remaining <= step:
+            # Land exactly on the waypoint (no drift) and turn onto the next segment
+            self.x, self.y = tx, ty
+            self.index     = (self.index + 1) % len(self.segs)
+            self.remaining = self.segs[self.index][4]
+        else:
+            self.remaining -= step
+            self.x += ux * step
+            self.y += uy * step
+        self.rect.topleft = (int(self.x) - 9, int(self.y) - 9)
+
+
+@dataclass(slots=True)
+class Room:
+    neighbors: dict[str, str]
+    platforms: list[pygame.Rect]
+    walls: list[pygame.Rect]
+    stairs: list[Stair]
+    stair_rects: list[pygame.Rect]
+    item_rects: list[pygame.Rect]   # uncollected items: pickup box and sprite position
+    enemies: list[Enemy]
+    enemy_rects: list[pygame.Rect]  # the enemies' own rects, moved in place
+    movers: list[Enemy]             # awake enemies, the only ones stepped
+    overlay: pygame.Surface      # platforms/walls/stairs inside overlay_band, transparent
+    overlay_band: pygame.Rect    # where overlay goes: its part of _BG_BAND (may be empty)
 
 
 # ── Player ──────────────────────────────────────────────────────────────────────
 
 class Player:
     W, H = 17, 23
+    __slots__ = (
+        "rect", "pos", "vel_y", "on_ground", "on_stairs", "coyote_timer",
+        "jump_buffer_timer", "stair_exit_timer", "facing",
+    )
 
     def __init__(self):
         self.rect  = pygame.Rect(20, GAME_H - 45, self.W, self.H)
@@ -135,27 +189,32 @@ class Player:
 
     def update(
         self,
-        dt: float,
         platforms: list[pygame.Rect],
         walls: list[pygame.Rect],
-        stairs: list[Stair],
-        keys,
+        stair_rects: list[pygame.Rect],
+        directions: tuple[bool, bool, bool, bool],
     ) -> None:
-        self.jump_buffer_timer = max(0.0, self.jump_buffer_timer - dt)
-        self.stair_exit_timer  = max(0.0, self.stair_exit_timer  - dt)
+        """Advance the player by one fixed PHYS_DT step."""
+        self.jump_buffer_timer = max(0.0, self.jump_buffer_timer - PHYS_DT)
+        self.stair_exit_timer  = max(0.0, self.stair_exit_timer  - PHYS_DT)
+
+        left, right, up, down = directions
 
         # ── Horizontal ─────────────────────────────────────────────────────────
         dx = 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            dx -= PLAYER_SPEED * dt
+        if left:
+            dx -= DX_PER_STEP
             self.facing = -1
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            dx += PLAYER_SPEED * dt
+        if right:
+            dx += DX_PER_STEP
             self.facing = 1
         self.pos.x  += dx
-        self.rect.x  = int(round(self.pos.x))
+        self.rect.x  = round(self.pos.x)
 
-        for wall in walls:
+        # collidelistall() finds candidates in C; each is re-tested because
+        # resolving an earlier hit may already have moved us clear of it.
+        for i in self.rect.collidelistall(walls):
+            wall = walls[i]
             if self.rect.colliderect(wall):
                 if dx > 0:
                     self.rect.right = wall.left
@@ -163,15 +222,10 @@ class Player:
                     self.rect.left = wall.right
 
         # ── Stair overlap (suppressed right after a jump) ─────────────────────
-        if self.stair_exit_timer <= 0:
-            self.on_stairs = any(self.rect.colliderect(s.rect) for s in stairs)
-        else:
-            self.on_stairs = False
+        stair_idx = self.rect.collidelist(stair_rects) if self.stair_exit_timer <= 0 else -1
+        self.on_stairs = stair_idx != -1
 
-        climbing = self.on_stairs and (
-            keys[pygame.K_UP] or keys[pygame.K_w] or
-            keys[pygame.K_DOWN] or keys[pygame.K_s]
-        )
+        climbing = self.on_stairs and (up or down)
 
         # ── Jump ───────────────────────────────────────────────────────────────
         # SPACE / UP / W all trigger jump.  SPACE is the safest on stairs.
@@ -186,28 +240,24 @@ class Player:
 
         # ── Vertical ───────────────────────────────────────────────────────────
         if climbing:
-            self.vel_y   = 0
-            climb_speed  = PLAYER_SPEED * 0.65
-            active_stair = next(
-                (s for s in stairs if self.rect.colliderect(s.rect)), None
-            )
-            if active_stair:
-                # Smoothly centre the player on the ladder/stair
-                cx = active_stair.rect.centerx - self.rect.width // 2
-                self.pos.x += (cx - self.pos.x) * min(1.0, dt * 18)
-            if keys[pygame.K_UP] or keys[pygame.K_w]:
-                self.pos.y -= climb_speed * dt
-            if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                self.pos.y += climb_speed * dt
+            self.vel_y = 0
+            # Smoothly centre the player on the ladder/stair found above
+            cx = stair_rects[stair_idx].centerx - self.rect.width // 2
+            self.pos.x += (cx - self.pos.x) * CENTRE_LERP
+            if up:
+                self.pos.y -= CLIMB_STEP
+            if down:
+                self.pos.y += CLIMB_STEP
         else:
-            self.vel_y  += GRAVITY * dt
-            self.pos.y  += self.vel_y * dt
+            self.vel_y  += GRAV_STEP
+            self.pos.y  += self.vel_y * PHYS_DT
 
-        self.rect.y = int(round(self.pos.y))
+        self.rect.y = round(self.pos.y)
 
         # ── Ground / wall collision ─────────────────────────────────────────────
         self.on_ground = False
-        for p in platforms:
+        for i in self.rect.collidelistall(platforms):
+            p = platforms[i]
             if (
                 self.rect.colliderect(p)
                 and self.vel_y >= 0
@@ -216,7 +266,8 @@ class Player:
                 self.rect.bottom = p.top
                 self.vel_y       = 0
                 self.on_ground   = True
-        for wall in walls:
+        for i in self.rect.collidelistall(walls):
+            wall = walls[i]
             if self.rect.colliderect(wall):
                 if self.vel_y >= 0:
                     self.rect.bottom = wall.top
@@ -227,20 +278,17 @@ class Player:
                     self.vel_y    = 0
 
         # ── Screen bounds ──────────────────────────────────────────────────────
-        self.rect.x = max(0, min(GAME_W - self.rect.width, self.rect.x))
-        self.pos.x  = float(self.rect.x)
-        if self.rect.bottom > GAME_H - 10:
-            self.rect.bottom = GAME_H - 10
-            self.vel_y       = 0
-            self.on_ground   = True
-        self.rect.top = max(0, self.rect.top)
-        self.pos.y    = float(self.rect.y)
+        self.rect.clamp_ip(WORLD_RECT)
+        if self.rect.bottom == WORLD_RECT.bottom:   # standing on the room floor
+            self.vel_y     = 0
+            self.on_ground = True
+        self.pos.update(self.rect.topleft)
 
         # ── Coyote timer ───────────────────────────────────────────────────────
         if self.on_ground:
             self.coyote_timer = 0.12
         else:
-            self.coyote_timer = max(0.0, self.coyote_timer - dt)
+            self.coyote_timer = max(0.0, self.coyote_timer - PHYS_DT)
 
     def jump(self):
         self.request_jump()
@@ -251,12 +299,23 @@ class Player:
 # the same on-screen but each logical pixel becomes a 2×2 block (ZX Spectrum look).
 
 class SpriteBank:
+    # Must be built after pygame.display.set_mode(): every Surface is converted
+    # to the display's pixel format so blits are straight copies.
     def __init__(self):
-        self.player_walk  = self._player_walk()
-        self.player_climb = self._player_climb()
-        self.player_jump  = self._player_jump()
-        self.enemy_walk   = self._enemy_walk()
-        self.collectible  = self._collectible()
+        self.player_walk  = [s.convert_alpha() for s in self._player_walk()]
+        self.player_climb = [s.convert_alpha() for s in self._player_climb()]
+        self.player_jump  = self._player_jump().convert_alpha()
+        self.enemy_walk   = [s.convert_alpha() for s in self._enemy_walk()]
+        self.collectible  = [s.convert_alpha() for s in self._collectible()]
+        self.background   = self._background().convert()
+        # Left-facing player frames, mirrored once instead of per frame
+        self.player_walk_left  = [self._mirror(f) for f in self.player_walk]
+        self.player_climb_left = [self._mirror(f) for f in self.player_climb]
+        self.player_jump_left  = self._mirror(self.player_jump)
+
+    @staticmethod
+    def _mirror(s: pygame.Surface) -> pygame.Surface:
+        return pygame.transform.flip(s, True, False)
 
     @staticmethod
     def _player_walk() -> list[pygame.Surface]:
@@ -346,21 +405,41 @@ class SpriteBank:
             frames.append(s)
         return frames
 
+    @staticmethod
+    def _background() -> pygame.Surface:
+        # Static vertical gradient, baked once; only the circles animate.
+        s = pygame.Surface((GAME_W, GAME_H))
+        for y in range(GAME_H):
+            shade = 20 + int(30 * (y / GAME_H))
+            pygame.draw.line(s, (shade, shade + 8, shade + 22), (0, y), (GAME_W, y))
+        return s
+
 
 # ── Persistence ─────────────────────────────────────────────────────────────────
+# Files are read as bytes: both orjson and stdlib json parse UTF-8 bytes
+# directly, skipping the str decode round-trip.
+
+def _json_loads(raw: bytes):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
 
+@functools.lru_cache(maxsize=1)
 def load_data() -> dict:
-    return json.loads(ROOMS_FILE.read_text())
+    """Parse rooms.json once; use load_data.cache_clear() to force a re-read."""
+    return _json_loads(ROOMS_FILE.read_bytes())
 
 
 def load_high_scores() -> list[dict]:
     if not SCORE_FILE.exists():
         return []
-    return json.loads(SCORE_FILE.read_text())
+    return _json_loads(SCORE_FILE.read_bytes())
 
 
 def save_high_scores(scores: list[dict]) -> None:
-    SCORE_FILE.write_text(json.dumps(scores[:10], indent=2))
+    if orjson:
+        SCORE_FILE.write_bytes(orjson.dumps(scores[:10], option=orjson.OPT_INDENT_2))
+    else:
+        SCORE_FILE.write_text(json.dumps(scores[:10], indent=2))
 
 
 # ── Room building ───────────────────────────────────────────────────────────────
@@ -373,16 +452,42 @@ def _r(xywh: list[int]) -> pygame.Rect:
     )
 
 
-def build_room(room_cfg: dict):
+def build_room(room_cfg: dict) -> Room:
     platforms  = [_r(p) for p in room_cfg["platforms"]]
     walls      = [_r(w) for w in room_cfg.get("walls", [])]
     stairs     = [
         Stair(_r(s["rect"]), s.get("target"), s.get("direction"))
         for s in room_cfg.get("stairs", [])
     ]
-    items      = [Collectible(pygame.Vector2(c[0] / RS, c[1] / RS)) for c in room_cfg["collectibles"]]
+    stair_rects = [s.rect for s in stairs]
+    item_rects = [
+        pygame.Rect(int(c[0] / RS) - 5, int(c[1] / RS) - 5, 10, 10)
+        for c in room_cfg["collectibles"]
+    ]
     enemies    = [Enemy(e["path"], e["speed"]) for e in room_cfg["enemies"]]
-    return platforms, walls, stairs, items, enemies
+    overlay    = draw_room_static(platforms, walls, stairs)
+    # Only the strip the circles can cover is ever redrawn; keep just that
+    band       = overlay.get_bounding_rect().clip(_BG_BAND)
+    return Room(
+        neighbors=room_cfg["neighbors"],
+        platforms=platforms,
+        walls=walls,
+        stairs=stairs,
+        stair_rects=stair_rects,
+        item_rects=item_rects,
+        enemies=enemies,
+        enemy_rects=[e.rect for e in enemies],
+        movers=[e for e in enemies if e.awake],
+        overlay=overlay.subsurface(band).copy(),
+        overlay_band=band,
+    )
+
+
+def bake_backdrop(room: Room, background: pygame.Surface) -> pygame.Surface:
+    """Opaque copy of *background* with the room's platforms, walls and stairs drawn in."""
+    backdrop = background.copy()
+    backdrop.blit(draw_room_static(room.platforms, room.walls, room.stairs), (0, 0))
+    return backdrop
 
 
 # ── Drawing helpers ─────────────────────────────────────────────────────────────
@@ -397,13 +502,81 @@ def draw_stair(surf: pygame.Surface, stair: Stair) -> None:
         )
 
 
-def draw_background(surf: pygame.Surface, t: float) -> None:
-    for y in range(GAME_H):
-        shade = 20 + int(30 * (y / GAME_H))
-        pygame.draw.line(surf, (shade, shade + 8, shade + 22), (0, y), (GAME_W, y))
-    for i in range(6):
-        x = int((i * 90 + math.sin(t + i) * 30) % GAME_W)
-        pygame.draw.circle(surf, (70, 100, 180), (x, 50 + i * 6), 25, 1)
+# (base x, y, sin i, cos i) of the six drifting background circles
+_BG_CIRCLES = tuple((i * 90, 50 + i * 6, math.sin(i), math.cos(i)) for i in range(6))
+
+
+def draw_room_static(
+    platforms: list[pygame.Rect],
+    walls: list[pygame.Rect],
+    stairs: list[Stair],
+) -> pygame.Surface:
+    """Bake a room's platforms, walls and stairs into one transparent overlay."""
+    surf = pygame.Surface((GAME_W, GAME_H), pygame.SRCALPHA)
+    for p in platforms:
+        pygame.draw.rect(surf, (120, 220, 230), p, border_radius=3)
+    for w in walls:
+        pygame.draw.rect(surf, ( 95, 125, 165), w, border_radius=2)
+    for stair in stairs:
+        draw_stair(surf, stair)
+    return surf.convert_alpha()
+
+
+# Game-canvas areas that change every playing frame regardless of entities
+_BG_BAND  = pygame.Rect(0, _BG_CIRCLES[0][1] - 25, GAME_W, _BG_CIRCLES[-1][1] - _BG_CIRCLES[0][1] + 51)
+_HUD_BAND = pygame.Rect(0, 0, GAME_W, 30)
+
+
+def present(window: pygame.Surface, game_surf: pygame.Surface, dirty: list[pygame.Rect] | None) -> None:
+    """
+    Upscale the game canvas into the window and push it to the display.
+
+    With *dirty* (game-space rects) only those regions are scaled and updated;
+    ``None`` rescales and flips the whole frame.
+    """
+    if dirty is None:
+        pygame.transform.scale(game_surf, (DISPLAY_W, DISPLAY_H), window)
+        pygame.display.flip()
+        return
+    # Bound to locals: the loop runs for every dirty rect of every playing frame
+    Rect, scale = pygame.Rect, pygame.transform.scale
+    src, dst_of = game_surf.subsurface, window.subsurface
+    bounds  = game_surf.get_rect()
+    updated = []
+    for r in dirty:
+        r = r.clip(bounds)
+        if not r.width or not r.height:
+            continue
+        dst = Rect(r.x * UPSCALE, r.y * UPSCALE, r.width * UPSCALE, r.height * UPSCALE)
+        scale(src(r), dst.size, dst_of(dst))
+        updated.append(dst)
+    pygame.display.update(updated)
+
+
+def draw_background(surf: pygame.Surface, background: pygame.Surface, t: float) -> None:
+    """Blit *background* (the gradient, or a room backdrop) and the drifting circles."""
+    surf.blit(background, (0, 0))
+    # sin(t + i) = sin t·cos i + cos t·sin i → one sin/cos pair per frame
+    st, ct = math.sin(t), math.cos(t)
+    for bx, y, si, ci in _BG_CIRCLES:
+        x = int((bx + (st * ci + ct * si) * 30) % GAME_W)
+        pygame.draw.circle(surf, (70, 100, 180), (x, y), 25, 1)
+
+
+# Fonts are registered by name in main(); render_cached() keys on that name so
+# identical HUD/label strings are rasterised once and then simply re-blitted.
+_FONTS: dict[str, pygame.font.Font] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def render_cached(font_id: str, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+    """Render *text* with the registered font *font_id*, reusing earlier Surfaces."""
+    return _FONTS[font_id].render(text, True, color).convert_alpha()
+
+
+def _centred(surf: pygame.Surface, y: int) -> tuple[pygame.Surface, tuple[int, int]]:
+    """(surface, position) pair that centres *surf* horizontally at row *y*."""
+    return surf, (GAME_W // 2 - surf.get_width() // 2, y)
 
 
 def _fmt_time(seconds: float) -> str:
@@ -438,6 +611,18 @@ def _place_on_stair(player: Player, target_stairs: list[Stair], from_room: str)
     player.on_ground  = False
 
 
+# ── Input ───────────────────────────────────────────────────────────────────────
+
+def read_directions(keys) -> tuple[bool, bool, bool, bool]:
+    """Snapshot (left, right, up, down) from a get_pressed() result."""
+    return (
+        keys[_K_LEFT] or keys[_K_A],
+        keys[_K_RIGHT] or keys[_K_D],
+        keys[_K_UP] or keys[_K_W],
+        keys[_K_DOWN] or keys[_K_S],
+    )
+
+
 # ── Main ────────────────────────────────────────────────────────────────────────
 
 def main() -> None:
@@ -446,13 +631,15 @@ def main() -> None:
     game_surf = pygame.Surface((GAME_W, GAME_H))
     pygame.display.set_caption("ManicWilly")
     clock   = pygame.time.Clock()
+    # Opt-in: busy-wait for steadier frame pacing at the cost of a spinning core
+    tick    = clock.tick_busy_loop if os.environ.get("MW_STABLE_FPS") == "1" else clock.tick
     sprites = SpriteBank()
     sounds  = Sounds()
 
     # Fonts rendered at game-canvas size → appear 2× larger after upscale
-    font  = pygame.font.SysFont("consolas", 12)
-    tiny  = pygame.font.SysFont("consolas",  8)
-    big   = pygame.font.SysFont("consolas", 14)
+    _FONTS["font"] = pygame.font.SysFont("consolas", 12)
+    _FONTS["tiny"] = pygame.font.SysFont("consolas",  8)
+    _FONTS["big"]  = pygame.font.SysFont("consolas", 14)
 
     data        = load_data()
     rooms       = data["rooms"]
@@ -463,98 +650,143 @@ def main() -> None:
     total_items = sum(len(r["collectibles"]) for r in rooms.values())
     high_scores = load_high_scores()
 
+    # Text that is fixed for the whole run, rendered and converted once up front
+    room_name_surfs = {
+        rid: _FONTS["tiny"].render(cfg["name"], True, (230, 230, 255)).convert_alpha()
+        for rid, cfg in rooms.items()
+    }
+    best_s = (
+        _FONTS["tiny"]
+        .render(f"Best {_fmt_time(high_scores[0]['seconds'])}", True, (255, 215, 0))
+        .convert_alpha()
+        if high_scores else None
+    )
+
+    # Splash text only changes between runs, so lay it out once up front
+    splash_blits = [
+        _centred(render_cached("big", "MANICWILLY", (240, 240, 255)), 48),
+        _centred(render_cached("tiny", "Jet-Set inspired platformer", (180, 210, 255)), 66),
+        _centred(render_cached("tiny", "Press ENTER to start", (255, 220, 130)), 82),
+        _centred(render_cached("tiny", "─── HIGH SCORES ───", (200, 230, 255)), 108),
+    ]
+    if high_scores:
+        for idx, sc in enumerate(high_scores[:10]):
+            rank_color = (
+                (255, 215,   0) if idx == 0 else
+                (192, 192, 192) if idx == 1 else
+                (205, 127,  50) if idx == 2 else
+                (200, 210, 230)
+            )
+            line = render_cached("tiny", f"{idx+1:>2}. {_fmt_time(sc['seconds'])}", rank_color)
+            splash_blits.append((line, (GAME_W // 2 - 28, 120 + idx * 10)))
+    else:
+        splash_blits.append(
+            _centred(render_cached("tiny", "No scores yet – be the first!", (180, 200, 220)), 122)
+        )
+    win_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+
     state   = "splash"
     elapsed = 0.0
-
-    room_state: dict = {}
+    t       = 0.0   # animation clock, advanced by the frame dt
+    hud_key = None  # (collected, whole seconds) shown by hud_s
+    hud_s   = None
+
+    room_state: dict[str, Room] = {}
+    backdrops: dict[str, pygame.Surface] = {}   # current room + neighbours, rebuilt on demand
+    if os.environ.get("MW_PRELOAD") == "1":
+        # Opt-in: build every room before the first frame instead of during the splash
+        room_state = {rid: build_room(cfg) for rid, cfg in rooms.items()}
+    preload          = iter(rooms)   # rooms still to prebuild during the splash
     stair_cooldown   = 0.0
+    phys_accum       = 0.0           # unsimulated time carried between frames
+    shown_room       = None          # room last pushed to the display in full
+    force_full       = True
 
     running = True
     while running:
-        dt = clock.tick(60) / 1000
+        dt = tick(60) * 0.001
         stair_cooldown = max(0.0, stair_cooldown - dt)
         if state == "playing":
             elapsed += dt
-        t = pygame.time.get_ticks() / 1000
+        t += dt
+        dirty: list[pygame.Rect] | None = None   # None → present the full frame
 
         # ── Events ─────────────────────────────────────────────────────────────
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                force_full = True
             elif event.type == pygame.KEYDOWN:
-                if state == "splash" and event.key == pygame.K_RETURN:
+                if state == "splash" and event.key == _K_RETURN:
                     state = "playing"
-                elif state == "playing" and event.key in (
-                    pygame.K_SPACE, pygame.K_w, pygame.K_UP
-                ):
+                    render_cached.cache_clear()
+                elif state == "playing" and event.key in (_K_SPACE, _K_W, _K_UP):
                     player.jump()
                     # Only play jump sound when the buffer is accepted
-                elif state == "win" and event.key == pygame.K_RETURN:
+                elif state == "win" and event.key == _K_RETURN:
                     running = False
 
         # ── Draw to game canvas ─────────────────────────────────────────────────
-        draw_background(game_surf, t)
+        # (the playing state draws its room's cached backdrop instead)
+        if state != "playing":
+            draw_background(game_surf, sprites.background, t)
 
         # ── Splash ─────────────────────────────────────────────────────────────
         if state == "splash":
-            title_s    = big.render("MANICWILLY", True, (240, 240, 255))
-            sub_s      = tiny.render("Jet-Set inspired platformer", True, (180, 210, 255))
-            prompt_s   = tiny.render("Press ENTER to start", True, (255, 220, 130))
-            hs_head_s  = tiny.render("─── HIGH SCORES ───", True, (200, 230, 255))
-
-            game_surf.blit(title_s, (GAME_W // 2 - title_s.get_width() // 2,  48))
-            game_surf.blit(sub_s,   (GAME_W // 2 - sub_s.get_width()   // 2,  66))
-            game_surf.blit(prompt_s,(GAME_W // 2 - prompt_s.get_width() // 2, 82))
-            game_surf.blit(hs_head_s,(GAME_W // 2 - hs_head_s.get_width() // 2, 108))
-
-            if high_scores:
-                for idx, sc in enumerate(high_scores[:10]):
-                    rank_color = (
-                        (255, 215,   0) if idx == 0 else
-                        (192, 192, 192) if idx == 1 else
-                        (205, 127,  50) if idx == 2 else
-                        (200, 210, 230)
-                    )
-                    line = tiny.render(
-                        f"{idx+1:>2}. {_fmt_time(sc['seconds'])}",
-                        True, rank_color,
-                    )
-                    game_surf.blit(line, (GAME_W // 2 - 28, 120 + idx * 10))
-            else:
-                no_s = tiny.render("No scores yet – be the first!", True, (180, 200, 220))
-                game_surf.blit(no_s, (GAME_W // 2 - no_s.get_width() // 2, 122))
+            # Build one room per splash frame so first visits don't hitch later
+            rid = next(preload, None)
+            if rid is not None and rid not in room_state:
+                room_state[rid] = build_room(rooms[rid])
+
+            game_surf.blits(splash_blits, doreturn=False)
 
         # ── Playing ────────────────────────────────────────────────────────────
         elif state == "playing":
             if room_id not in room_state:
                 room_state[room_id] = build_room(rooms[room_id])
-            platforms, walls, stairs, items, enemies = room_state[room_id]
-
-            keys = pygame.key.get_pressed()
-            player.update(dt, platforms, walls, stairs, keys)
+            room       = room_state[room_id]
+            stairs     = room.stairs
+            enemies    = room.enemies
+            drawn_room = room_id
+
+            backdrop = backdrops.get(room_id)
+            if backdrop is None:
+                backdrop = backdrops[room_id] = bake_backdrop(room, sprites.background)
+                # Pure render cache: keep this room and its neighbours only
+                keep = {room_id, *room.neighbors.values()}
+                for rid in [rid for rid in backdrops if rid not in keep]:
+                    del backdrops[rid]
+
+            # Previous positions of everything that can move or animate
+            dirty  = [_BG_BAND, _HUD_BAND, player.rect.copy()]
+            dirty += [enemy.rect.copy() for enemy in enemies]
+            dirty += room.item_rects
+
+            # Key state is read once per frame and shared by every physics step
+            directions = read_directions(pygame.key.get_pressed())
+            phys_accum = min(phys_accum + dt, MAX_FRAME_DT)
+            while phys_accum >= PHYS_DT:
+                player.update(room.platforms, room.walls, room.stair_rects, directions)
+                for enemy in room.movers:
+                    enemy.update()
+                phys_accum -= PHYS_DT
 
             # Enemy collision → respawn
-            for enemy in enemies:
-                enemy.update(dt)
-                if player.rect.colliderect(enemy.rect()):
-                    sounds.play("die")
-                    player.rect.topleft = (20, GAME_H - 45)
-                    player.pos.update(player.rect.topleft)
-                    player.vel_y = 0
-
-            # Collect items
-            for item in items:
-                if not item.taken:
-                    hit = pygame.Rect(
-                        int(item.pos.x) - 5, int(item.pos.y) - 5, 10, 10
-                    )
-                    if player.rect.colliderect(hit):
-                        item.taken  = True
-                        collected  += 1
-                        sounds.play("collect")
+            if player.rect.collidelist(room.enemy_rects) != -1:
+                sounds.play("die")
+                player.rect.topleft = (20, GAME_H - 45)
+                player.pos.update(player.rect.topleft)
+                player.vel_y = 0
+
+            # Collect items; picked-up rects leave the room's live list
+            for i in reversed(player.rect.collidelistall(room.item_rects)):
+                room.item_rects.pop(i)
+                collected += 1
+                sounds.play("collect")
 
             # ── Room transitions ────────────────────────────────────────────────
-            neighbors = rooms[room_id]["neighbors"]
+            neighbors = room.neighbors
             if player.rect.left <= 0 and "left" in neighbors:
                 prev_room     = room_id
                 room_id       = neighbors["left"]
@@ -570,21 +802,17 @@ def main() -> None:
                 stair_cooldown = 0.15
                 sounds.play("transition")
             else:
-                for stair in stairs:
+                _, _, going_up, going_down = directions
+                for i in player.rect.collidelistall(room.stair_rects):
+                    stair = stairs[i]
                     if stair_cooldown > 0 or not stair.target:
                         continue
-                    on_stair = player.rect.colliderect(stair.rect)
-                    if not on_stair:
-                        continue
-                    going_up   = keys[pygame.K_UP] or keys[pygame.K_w]
-                    going_down = keys[pygame.K_DOWN] or keys[pygame.K_s]
                     if stair.direction == "up" and going_up:
                         prev_room = room_id
                         room_id   = stair.target
                         if room_id not in room_state:
                             room_state[room_id] = build_room(rooms[room_id])
-                        _, _, t_stairs, _, _ = room_state[room_id]
-                        _place_on_stair(player, t_stairs, prev_room)
+                        _place_on_stair(player, room_state[room_id].stairs, prev_room)
                         stair_cooldown = 0.22
                         sounds.play("transition")
                         break
@@ -593,88 +821,90 @@ def main() -> None:
                         room_id   = stair.target
                         if room_id not in room_state:
                             room_state[room_id] = build_room(rooms[room_id])
-                        _, _, t_stairs, _, _ = room_state[room_id]
-                        _place_on_stair(player, t_stairs, prev_room)
+                        _place_on_stair(player, room_state[room_id].stairs, prev_room)
                         stair_cooldown = 0.22
                         sounds.play("transition")
                         break
 
             # ── Rendering ───────────────────────────────────────────────────────
-            for p in platforms:
-                pygame.draw.rect(game_surf, (120, 220, 230), p, border_radius=3)
-            for w in walls:
-                pygame.draw.rect(game_surf, ( 95, 125, 165), w, border_radius=2)
-            for stair in stairs:
-                draw_stair(game_surf, stair)
+            # One opaque backdrop blit; only geometry overlapping the circle
+            # band is re-blitted so it still sits in front of the circles.
+            draw_background(game_surf, backdrop, t)
+            if room.overlay_band:
+                game_surf.blit(room.overlay, room.overlay_band)
 
             item_frame = sprites.collectible[int(t * 9) % len(sprites.collectible)]
-            for item in items:
-                if not item.taken:
-                    game_surf.blit(
-                        item_frame,
-                        (int(item.pos.x) - 5, int(item.pos.y) - 5),
-                    )
-
-            for enemy in enemies:
-                er    = enemy.rect()
-                frame = sprites.enemy_walk[int((t * 8 + enemy.pos.x * 0.02)) % 4]
-                game_surf.blit(frame, er.topleft)
+            game_surf.blits([(item_frame, r) for r in room.item_rects], doreturn=False)
+
+            enemy_phase = t * 8
+            enemy_walk  = sprites.enemy_walk
+            game_surf.blits(
+                [(enemy_walk[int(enemy_phase + e.x * 0.02) % 4], e.rect) for e in enemies],
+                doreturn=False,
+            )
 
             # Player sprite selection
+            left = player.facing < 0
             if player.on_stairs:
-                frame = sprites.player_climb[int(t * 8) % 2]
+                climb = sprites.player_climb_left if left else sprites.player_climb
+                frame = climb[int(t * 8) % 2]
             elif not player.on_ground:
-                frame = sprites.player_jump
+                frame = sprites.player_jump_left if left else sprites.player_jump
             else:
-                frame = sprites.player_walk[int(t * 10) % 4]
-
-            if player.facing < 0:
-                frame = pygame.transform.flip(frame, True, False)
+                walk  = sprites.player_walk_left if left else sprites.player_walk
+                frame = walk[int(t * 10) % 4]
             game_surf.blit(frame, player.rect.topleft)
+            dirty.append(player.rect)
+            dirty += [enemy.rect for enemy in enemies]
+            if drawn_room != shown_room:
+                dirty      = None
+                shown_room = drawn_room
 
             # ── HUD ─────────────────────────────────────────────────────────────
-            room_text = tiny.render(rooms[room_id]["name"], True, (230, 230, 255))
-            hud_items = tiny.render(
-                f"Items {collected}/{total_items}  Time {_fmt_time(elapsed)}",
-                True, (255, 255, 255),
-            )
+            room_text = room_name_surfs[room_id]
+            if hud_key != (collected, int(elapsed)):
+                hud_key = (collected, int(elapsed))
+                hud_s   = render_cached(
+                    "tiny", f"Items {collected}/{total_items}  Time {_fmt_time(elapsed)}",
+                    (255, 255, 255),
+                )
             game_surf.blit(room_text, (6, 6))
-            game_surf.blit(hud_items, (6, 16))
+            game_surf.blit(hud_s, (6, 16))
 
             # Best score hint
-            if high_scores:
-                best = tiny.render(
-                    f"Best {_fmt_time(high_scores[0]['seconds'])}",
-                    True, (255, 215, 0),
-                )
-                game_surf.blit(best, (GAME_W - best.get_width() - 4, 6))
+            if best_s:
+                game_surf.blit(best_s, (GAME_W - best_s.get_width() - 4, 6))
 
             # Win condition
             if collected >= total_items:
                 sounds.play("win")
                 high_scores.append({"seconds": elapsed})
-                high_scores = sorted(high_scores, key=lambda v: v["seconds"])[:10]
+                high_scores = heapq.nsmallest(10, high_scores, key=itemgetter("seconds"))
                 save_high_scores(high_scores)
                 state = "win"
+                render_cached.cache_clear()
+                rank = next((i + 1 for i, sc in enumerate(high_scores) if sc["seconds"] == elapsed), "?")
+                win_blits = [
+                    _centred(render_cached("font", "All items collected!", (255, 240, 180)), 90),
+                    _centred(render_cached("tiny", f"Your time: {_fmt_time(elapsed)}", (230, 230, 255)), 108),
+                    _centred(render_cached(
+                        "tiny",
+                        f"Rank #{rank}  Best: {_fmt_time(high_scores[0]['seconds'])}",
+                        (255, 215, 0),
+                    ), 120),
+                    _centred(render_cached("tiny", "Press ENTER to exit.", (180, 210, 255)), 135),
+                ]
 
         # ── Win ────────────────────────────────────────────────────────────────
         elif state == "win":
-            done_s   = font.render("All items collected!", True, (255, 240, 180))
-            time_s   = tiny.render(f"Your time: {_fmt_time(elapsed)}", True, (230, 230, 255))
-            exit_s   = tiny.render("Press ENTER to exit.", True, (180, 210, 255))
-            rank_s   = tiny.render(
-                f"Rank #{next((i+1 for i,s in enumerate(high_scores) if s['seconds'] == elapsed), '?')}  "
-                f"Best: {_fmt_time(high_scores[0]['seconds'])}",
-                True, (255, 215, 0),
-            )
-            game_surf.blit(done_s, (GAME_W//2 - done_s.get_width()//2, 90))
-            game_surf.blit(time_s, (GAME_W//2 - time_s.get_width()//2, 108))
-            game_surf.blit(rank_s, (GAME_W//2 - rank_s.get_width()//2, 120))
-            game_surf.blit(exit_s, (GAME_W//2 - exit_s.get_width()//2, 135))
+            game_surf.blits(win_blits, doreturn=False)
 
         # ── Upscale game canvas → display window (gives the chunky pixel look) ─
-        pygame.transform.scale(game_surf, (DISPLAY_W, DISPLAY_H), window)
-        pygame.display.flip()
+        if force_full or state != "playing":
+            dirty      = None
+            force_full = False
+            shown_room = None
+        present(window, game_surf, dirty)
 
     pygame.quit()
 
@@ -2,14 +2,23 @@ from __future__ import annotations
 
 import json
 from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson            # optional: faster JSON parse when installed
+except ImportError:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 ROOMS_FILE = ROOT / "data" / "rooms.json"
 
 
+@lru_cache(maxsize=1)
 def load_rooms() -> dict:
-    payload = json.loads(ROOMS_FILE.read_text())
+    """Parse the level data once; callers share the result and must not mutate it."""
+    raw = ROOMS_FILE.read_bytes()
+    payload = orjson.loads(raw) if orjson else json.loads(raw)
     return payload
 
 
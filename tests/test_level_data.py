@@ -52,3 +52,42 @@ def test_map_has_rooms_above_and_below():
     payload = load_rooms()
     valid, msg = validate_vertical_connectivity_coverage(payload)
     assert valid, msg
+
+
+def _payload(rooms: dict, start: str = "a") -> dict:
+    base = {"neighbors": {}, "platforms": [], "walls": [], "stairs": [], "collectibles": []}
+    return {"start_room": start, "rooms": {rid: {**base, **cfg} for rid, cfg in rooms.items()}}
+
+
+def test_graph_rejects_unknown_neighbor():
+    payload = _payload({"a": {"neighbors": {"right": "zz"}}})
+    assert validate_graph(payload) == (False, "room a points to unknown neighbor zz")
+
+
+def test_graph_rejects_unreachable_room():
+    payload = _payload({"a": {}, "b": {"neighbors": {"left": "a"}}})
+    assert validate_graph(payload) == (False, "graph disconnected: visited 1 of 2")
+
+
+def test_full_clear_reports_unreachable_room_with_unknown_neighbor():
+    payload = _payload({"a": {}, "b": {"neighbors": {"right": "zz"}}})
+    assert simulate_full_clear(payload) == (False, "full-clear traversal reached 1 / 2 rooms")
+
+
+def test_full_clear_requires_stair_for_vertical_link():
+    payload = _payload({"a": {"neighbors": {"up": "b"}}, "b": {"neighbors": {"down": "a"}}})
+    assert simulate_full_clear(payload) == (False, "room a cannot traverse up to b")
+
+
+def test_unique_layouts_rejects_duplicate_rooms():
+    layout = {"platforms": [[0, 100, 80, 10]], "walls": [[40, 60, 10, 40]],
+              "stairs": [{"direction": "up", "target": "c", "rect": [10, 20, 16, 80]}]}
+    payload = _payload({"a": layout, "b": {**layout, "collectibles": [[5, 5]]}})
+    assert validate_unique_room_layouts(payload) == (False, "rooms a and b share identical layout")
+
+
+def test_unique_layouts_accepts_near_duplicate_rooms():
+    layout = {"platforms": [[0, 100, 80, 10]], "walls": [[40, 60, 10, 40]],
+              "stairs": [{"direction": "up", "target": "c", "rect": [10, 20, 16, 80]}]}
+    payload = _payload({"a": layout, "b": {**layout, "walls": [[40, 60, 10, 41]]}})
+    assert validate_unique_room_layouts(payload) == (True, "ok")
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import pygame
+
+from manicwilly_game import PHYS_DT, Player
+
+STEPS_PER_SECOND = round(1 / PHYS_DT)
+IDLE = (False, False, False, False)
+FLOOR = [pygame.Rect(0, 223, 480, 10)]
+STAIR = [pygame.Rect(10, 20, 40, 270)]
+
+
+def _player_at(x: int, y: int) -> Player:
+    player = Player()
+    player.rect.topleft = (x, y)
+    player.pos.update(player.rect.topleft)
+    return player
+
+
+def test_climb_speed_matches_tuned_rate_both_ways():
+    player = _player_at(20, 150)
+    start = player.rect.y
+    for _ in range(STEPS_PER_SECOND):
+        player.update([], [], STAIR, (False, False, True, False))
+    assert start - player.rect.y == 60
+
+    start = player.rect.y
+    for _ in range(STEPS_PER_SECOND):
+        player.update([], [], STAIR, (False, False, False, True))
+    assert player.rect.y - start == 60
+
+
+def test_walk_speed_matches_tuned_rate():
+    player = _player_at(20, 200)
+    for _ in range(STEPS_PER_SECOND):
+        player.update(FLOOR, [], [], IDLE)
+    start = player.rect.x
+    for _ in range(STEPS_PER_SECOND):
+        player.update(FLOOR, [], [], (False, True, False, False))
+    assert player.rect.x - start == 120
+
+
+def test_standing_jump_starts_on_the_next_step():
+    player = _player_at(20, 200)
+    for _ in range(STEPS_PER_SECOND):
+        player.update(FLOOR, [], [], IDLE)
+    # Press jump at every phase of an idle stand: it must never be ignored
+    for _ in range(STEPS_PER_SECOND * 2):
+        standing = _player_at(player.rect.x, player.rect.y)
+        standing.vel_y, standing.on_ground = player.vel_y, player.on_ground
+        standing.coyote_timer = player.coyote_timer
+        standing.jump()
+        standing.update(FLOOR, [], [], IDLE)
+        assert standing.vel_y < 0
+        player.update(FLOOR, [], [], IDLE)